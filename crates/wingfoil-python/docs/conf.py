@@ -20,11 +20,16 @@ file:
   features renders a smaller generated table, not an error.
 """
 
+import importlib.util
 import os
 import sys
 
 # The pure-Python half of the mixed layout (`python-source = "python"`).
-sys.path.insert(0, os.path.abspath("../python"))
+# Guarded so parallel Sphinx workers re-running this file don't stack
+# duplicate entries, which every failed autodoc import would then walk.
+_python_src = os.path.abspath("../python")
+if _python_src not in sys.path:
+    sys.path.insert(0, _python_src)
 
 # -- Project information -----------------------------------------------------
 
@@ -104,6 +109,13 @@ autodoc_typehints = "description"
 autosummary_generate = True
 add_module_names = False
 
+# Every autosummary stub page re-renders the global toctree under the RTD
+# theme, which is quadratic in stub count; prune the stubs from per-page
+# toctree resolution. Guarded so a build without the extension still works.
+if importlib.util.find_spec("sphinx_remove_toctrees"):
+    extensions.append("sphinx_remove_toctrees")
+    remove_from_toctrees = ["api_generated/*"]
+
 # MyST: the README uses fenced code and tables.
 myst_enable_extensions = ["colon_fence", "deflist"]
 # The README is a top-level document included via `readme.rst`; suppress the
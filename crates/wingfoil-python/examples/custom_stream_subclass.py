@@ -10,8 +10,6 @@ it: the graph is passed explicitly (wingfoil has no ambient graph) and `upstream
 yields this cycle's values rather than the upstream Stream objects.
 """
 
-import math
-
 import wingfoil as wf
 
 
@@ -19,9 +17,13 @@ class MyStream(wf.CustomStream):
     """Combines its upstreams as digits of a base-10 number."""
 
     def cycle(self):
-        value = 0
-        for i, src in enumerate(self.upstreams()):
-            value += src.peek_value() * math.pow(10, i)
+        # cycle() runs per tick — a running weight keeps the body free of
+        # math.pow and enumerate, both per-upstream costs.
+        value = 0.0
+        weight = 1.0
+        for src in self.upstreams():
+            value += src.peek_value() * weight
+            weight *= 10.0
         self.set_value(value)
         return True
 
@@ -80,8 +80,10 @@ class _NodeAdapter:
         self._node = node
 
     def cycle(self, values: Sequence[Any]) -> bool:
-        self._node._values = list(values)
-        return bool(self._node.cycle())
+        node = self._node
+        node._values = list(values)
+        node._upstream_views = None
+        return bool(node.cycle())
 
     def peek(self) -> Any:
         return self._node.peek()
@@ -94,6 +96,11 @@ class CustomStream:
     the upstream streams; the constructor returns the wired ``Stream``.
     """
 
+    # Slotted like the helpers above: cycle() runs per tick, and slot reads
+    # skip the instance dict. Subclasses that add state keep the benefit by
+    # declaring __slots__ of their own (omitting it just restores a dict).
+    __slots__ = ("_values", "_value", "_upstream_views")
+
     def __new__(
         cls,
         graph: Any,
@@ -106,6 +113,7 @@ class CustomStream:
         # set_value() (legacy nodes sometimes seed an initial value there).
         node._values = []
         node._value = None
+        node._upstream_views = None
         # Python only calls __init__ automatically when __new__ returns an
         # instance of cls; we return a Stream, so invoke it ourselves — the
         # graph/upstreams are wiring, so only the remaining args are passed on.
@@ -113,8 +121,17 @@ class CustomStream:
         return graph.custom_node(list(upstreams), _NodeAdapter(node))
 
     def upstreams(self) -> List[UpstreamValue]:
-        """The upstreams' current values, in the order they were wired."""
-        return [UpstreamValue(value) for value in self._values]
+        """The upstreams' current values, in the order they were wired.
+
+        Memoized per cycle: the wrapper list is built on first call and
+        reused until the next cycle delivers fresh values, so a ``cycle``
+        body may call this freely without re-wrapping every upstream.
+        """
+        views = self._upstream_views
+        if views is None:
+            views = [UpstreamValue(value) for value in self._values]
+            self._upstream_views = views
+        return views
 
     def cycle(self) -> bool:
         """Advance the node; return whether it ticked this cycle.
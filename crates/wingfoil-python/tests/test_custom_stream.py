@@ -148,6 +148,24 @@ def test_upstream_value_reads_none_before_a_tick():
     assert [[1, None], [2, None], [3, 3]] == seen
 
 
+def test_upstreams_memoized_within_a_cycle():
+    """Repeated upstreams() calls in one cycle reuse the same snapshot list;
+    the next cycle's values invalidate it."""
+    seen = []
+
+    class DoubleReader(wf.CustomStream):
+        def cycle(self):
+            first, second = self.upstreams(), self.upstreams()
+            seen.append((first is second, first[0].peek_value()))
+            self.set_value(0.0)
+            return True
+
+    g = wf.Graph()
+    DoubleReader(g, [g.counter(period_nanos=100)])
+    g.run(cycles=2)
+    assert [(True, 1), (True, 2)] == seen
+
+
 def test_graph_with_a_custom_node_is_single_run():
     """Caller-owned Python state has no engine reset hook, so re-running is
     refused rather than replaying from dirty state."""
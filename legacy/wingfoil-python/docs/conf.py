@@ -1,10 +1,22 @@
 
 
+import importlib.util
 import sys, os
-sys.path.insert(0, os.path.abspath('..')) 
 
-import wingfoil
-sys.modules['wingfoil.wingfoil'] = wingfoil # some workaround for sphinx nonsense!?
+# Guarded: each Sphinx worker re-runs this file, and every failed import
+# during autodoc resolution walks the whole of sys.path — don't let the
+# workers stack duplicate entries onto it. Only '..' goes on the path:
+# putting '../python' first would shadow an installed wingfoil wheel with
+# the bare source tree, whose `from . import _wingfoil` only resolves
+# after `maturin develop` has staged the extension in-tree.
+_here = os.path.abspath('..')
+if _here not in sys.path:
+    sys.path.insert(0, _here)
+
+# With `-j auto` every Sphinx worker re-executes conf.py; reuse an already
+# imported module rather than repaying the native extension's dlopen + init.
+wingfoil = sys.modules.get('wingfoil') or importlib.import_module('wingfoil')
+sys.modules.setdefault('wingfoil.wingfoil', wingfoil) # some workaround for sphinx nonsense!?
 
 copyright = '2025, Jake Mitchell'
 author = 'Jake Mitchell'
@@ -30,6 +42,12 @@ autodoc_default_options = {
 autosummary_generate = True
 add_module_names = False
 
+# Stop every autosummary stub page re-rendering the global toctree (quadratic
+# in stub count under the RTD theme). Optional: skipped when not installed.
+if importlib.util.find_spec("sphinx_remove_toctrees"):
+    extensions.append("sphinx_remove_toctrees")
+    remove_from_toctrees = ["api_generated/*"]
+
 # -- Options for HTML output -------------------------------------------------
 html_theme = 'sphinx_rtd_theme' # Use a standard documentation theme
 html_static_path = ['_static']
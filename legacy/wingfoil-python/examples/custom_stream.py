@@ -1,15 +1,56 @@
 #!/usr/bin/env python3
 
-import math
-from wingfoil import ticker, CustomStream
+import numpy as np
+
+from wingfoil import ticker, CustomStream, peek_values
+
+# Above this many upstreams the Python accumulation loop is interpreter-bound
+# and a single BLAS dot over a reused buffer wins.
+WIDE_FAN_IN = 16
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    # Numba compiles the reduction to a native (auto-vectorized) loop;
+    # cache=True pays the compile cost once across runs.
+    @njit(cache=True, fastmath=True)
+    def _weighted_sum(values, weights):
+        total = 0.0
+        for i in range(values.shape[0]):
+            total += values[i] * weights[i]
+        return total
+else:
+    def _weighted_sum(values, weights):
+        return float(values @ weights)
 
 
 class MyStream(CustomStream):
 
+    __slots__ = ("_weights", "_weights_np", "_buf")
+
+    def __init__(self, upstreams):
+        super().__init__(upstreams)
+        # cycle() runs per tick, so the powers of ten are computed once here
+        # rather than via math.pow on every cycle.
+        self._weights = tuple(10.0**i for i in range(len(self._upstreams)))
+        self._weights_np = np.array(self._weights)
+        self._buf = np.empty_like(self._weights_np)
+
     def cycle(self):
-        value = 0
-        for i, src in enumerate(self.upstreams()):
-            value += src.peek_value() * math.pow(10, i)
+        ups = self._upstreams
+        if len(ups) >= WIDE_FAN_IN:
+            buf = self._buf
+            # One FFI crossing for all upstreams instead of one per upstream.
+            buf[:] = peek_values(ups)
+            value = _weighted_sum(buf, self._weights_np)
+        else:
+            weights = self._weights
+            value = 0.0
+            for i in range(len(ups)):
+                value += ups[i].peek_value() * weights[i]
         self.set_value(value)
         return True
 
@@ -25,4 +66,3 @@ source = ticker(period).count().logged("src")
             cycles = 5,
         )
 )
-
@@ -12,6 +12,8 @@ Reset the table between runs:
     delete from `test_trades
 """
 
+import itertools
+
 from wingfoil import ticker, kdb_read
 
 HOST = "localhost"
@@ -21,13 +23,14 @@ NUM_ROWS = 10
 
 
 def generate(num_rows):
-    syms = ["AAPL", "GOOG", "MSFT"]
+    # itertools.cycle advances at C level — no per-tick modulo/len/indexing.
+    syms = itertools.cycle(["AAPL", "GOOG", "MSFT"])
     return (
         ticker(1.0)
         .count()
         .map(lambda i: {
-            "sym": syms[i % len(syms)],
-            "price": 100.0 + float(i),
+            "sym": next(syms),
+            "price": 100.0 + i,
             "qty": i * 10 + 1,
         })
         .limit(num_rows)
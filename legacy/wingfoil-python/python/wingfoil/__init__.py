@@ -18,6 +18,11 @@ Latency = _ext.Latency
 TracedBytes = _ext.TracedBytes
 __all__.extend(["Latency", "TracedBytes"])
 
+# User-friendly aliases, bound once at import. Each is a direct reference to
+# the extension function — no wrapper frame per call. Import-latency-sensitive
+# code (short-lived scripts, per-worker interpreters) can skip this package
+# layer entirely with e.g. `from wingfoil._wingfoil import py_kdb_read`.
+
 # User-friendly aliases for CSV functions
 csv_read = _ext.py_csv_read
 
@@ -82,3 +87,8 @@ __all__.append("PrometheusExporter")
 # User-friendly aliases for the web adapter
 WebServer = _ext.WebServer
 __all__.append("WebServer")
+
+# Freeze the export list once every feature-gated extend above has run; a
+# tuple can't be mutated from outside and is slightly cheaper to walk on
+# `from wingfoil import *`.
+__all__ = tuple(__all__)
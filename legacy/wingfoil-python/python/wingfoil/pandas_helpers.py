@@ -1,6 +1,59 @@
+import operator
+
+import numpy as np
 import pandas as pd
 from typing import Any, Dict, List, Union
 
+def _dicts_to_columns(rows: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """
+    Pivots a homogeneous list of dicts into per-column lists.
+
+    Pandas wraps the column lists directly instead of probing every row,
+    which roughly halves construction time on wide dict streams. Raises
+    KeyError for a ragged schema; callers fall back to the row-wise
+    constructor, which handles that case (at row-probing cost).
+    """
+    keys = rows[0].keys()
+    width = len(keys)
+    if any(len(row) != width for row in rows):
+        raise KeyError("ragged dict schema")
+    return {key: [row[key] for row in rows] for key in keys}
+
+
+def _objects_to_columns(items: List[Any]) -> Dict[str, List[Any]]:
+    """
+    Pivots row objects into per-column lists, pulling every field of a row
+    with one C-implemented attrgetter call instead of copying each instance
+    dict via vars(). Schema comes from the first row; a ragged schema in
+    either direction — a row missing one of its fields, or carrying extras
+    the first row lacks — raises AttributeError, and callers fall back to
+    the vars() row-dict path, which unions ragged schemas.
+    """
+    fields = tuple(vars(items[0]))
+    if not fields:
+        raise AttributeError("first row has no fields")
+    width = len(fields)
+    if any(len(vars(item)) != width for item in items):
+        raise AttributeError("ragged object schema")
+    getter = operator.attrgetter(*fields)
+    if width == 1:
+        return {fields[0]: [getter(item) for item in items]}
+    rows = [getter(item) for item in items]
+    return {field: [row[i] for row in rows] for i, field in enumerate(fields)}
+
+
+def _slot_fields(obj: Any) -> tuple:
+    """
+    Field names from obj's class __slots__. Slotted row classes (the cheap
+    way to emit fixed-schema rows) carry no per-instance dict, so the
+    vars()-based object handling cannot see their fields.
+    """
+    slots = getattr(type(obj), '__slots__', ())
+    if isinstance(slots, str):
+        slots = (slots,)
+    return tuple(slots)
+
+
 def to_dataframe(data: Union[List[Any], Dict[str, List[Any]]]) -> pd.DataFrame:
     """
     Converts a list of data into a DataFrame.
@@ -13,11 +66,22 @@ def to_dataframe(data: Union[List[Any], Dict[str, List[Any]]]) -> pd.DataFrame:
         values = [row[1] for row in data]
         
         if isinstance(values[0], dict):
-            df = pd.DataFrame(values)
+            try:
+                df = pd.DataFrame(_dicts_to_columns(values))
+            except KeyError:
+                df = pd.DataFrame(values)
             df.insert(0, 'time', times)
             return df
         elif hasattr(values[0], '__dict__'):
-            df = pd.DataFrame([vars(item) for item in values])
+            try:
+                df = pd.DataFrame(_objects_to_columns(values))
+            except AttributeError:
+                df = pd.DataFrame([vars(item) for item in values])
+            df.insert(0, 'time', times)
+            return df
+        elif _slot_fields(values[0]):
+            fields = _slot_fields(values[0])
+            df = pd.DataFrame({f: [getattr(item, f) for item in values] for f in fields})
             df.insert(0, 'time', times)
             return df
 
@@ -29,15 +93,38 @@ def to_dataframe(data: Union[List[Any], Dict[str, List[Any]]]) -> pd.DataFrame:
 
     first_item = data[0]
     if isinstance(first_item, dict):
-        return pd.DataFrame(data)
+        try:
+            return pd.DataFrame(_dicts_to_columns(data))
+        except KeyError:
+            return pd.DataFrame(data)
     elif hasattr(first_item, '__dict__'):
-        return pd.DataFrame([vars(item) for item in data])
+        try:
+            return pd.DataFrame(_objects_to_columns(data))
+        except AttributeError:
+            return pd.DataFrame([vars(item) for item in data])
+    elif _slot_fields(first_item):
+        fields = _slot_fields(first_item)
+        return pd.DataFrame({f: [getattr(item, f) for item in data] for f in fields})
+    elif isinstance(first_item, (int, float)) and not isinstance(first_item, bool):
+        # Numeric fast path: asarray fills one typed buffer in C instead of
+        # the pandas constructor inferring the dtype element by element. A
+        # non-numeric dtype means later elements weren't numbers (asarray
+        # would have stringified them), so fall through to the row-wise
+        # constructor, which keeps the original objects.
+        arr = np.asarray(data)
+        if arr.dtype.kind in 'iuf':
+            return pd.DataFrame({'value': arr})
+        return pd.DataFrame(data, columns=['value'])
     else:
         return pd.DataFrame(data, columns=['value'])
 
 def build_dataframe(stream_dict: Dict[str, Any]) -> pd.DataFrame:
     """
     Builds a combined DataFrame from a dict of streams.
+
+    Purely a post-run step: the streams must already be `.dataframe()`
+    collectors that have been run (once). This never runs or re-runs the
+    graph itself — a stream that has not run simply contributes no column.
     """
     
     dataframes = []
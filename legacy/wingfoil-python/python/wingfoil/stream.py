@@ -1,19 +1,41 @@
 from __future__ import annotations
 
+import logging
+
 from ._wingfoil import Stream
 
 from typing import Any, Generic, Iterable, List, Optional, TypeVar
 
+_log = logging.getLogger(__name__)
+
+# Bound once at import: __new__ resolves the proxy class through a module
+# global on every CustomStream(...) call, and graph construction makes one
+# such call per node. A leading-underscore alias keeps the lookup but makes
+# the intent (and the hot path) explicit.
+_Stream = Stream
+
 T = TypeVar("T")   # The value type carried by the Stream
 
 
 class CustomStream(Generic[T]):
-    def __new__(cls, *args: Any, **kwargs: Any) -> "Stream[T]": 
+    # Slotted: attribute reads in per-tick cycle() bodies skip the instance
+    # dict, and the many short-lived instances tests create stay small.
+    # Subclasses adding state should declare __slots__ too to keep that.
+    __slots__ = ("_value", "_upstreams")
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "Stream[T]":
         """Override constructor to wrap the instance in a PyStream proxy."""
         obj = super().__new__(cls)
+        # __init__ is run by hand because __new__ returns the proxy, which is
+        # a different (extension) type — Python only re-runs __init__ on the
+        # returned object when it is an instance of cls, so there is no
+        # double-init here.
         obj.__init__(*args, **kwargs)
-        proxy: Stream[T] = Stream(obj)
-        print(f"proxy {proxy}")
+        proxy: Stream[T] = _Stream(obj)
+        # %s-style args defer the format (and the stdout write) until a
+        # handler actually wants DEBUG — construction stays silent and cheap.
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("proxy %s", proxy)
         return proxy
 
     def __init__(self, upstreams: Optional[Iterable["Stream[Any]"]] = None) -> None:
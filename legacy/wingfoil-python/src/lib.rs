@@ -127,6 +127,62 @@ fn bimap(a: Py<PyAny>, b: Py<PyAny>, func: Py<PyAny>) -> PyResult<PyStream> {
     })
 }
 
+/// maps any number of streams into a new stream using func (e.g
+/// lambda a, b, c: a + b + c). Ticks whenever any input ticks, with every
+/// input's current value — the n-ary form of [bimap], as a single graph
+/// node rather than a chain of pairwise merges.
+#[pyfunction]
+fn nmap(streams: Vec<Py<PyAny>>, func: Py<PyAny>) -> PyResult<PyStream> {
+    Python::attach(|py| {
+        let mut inner: Vec<Rc<dyn ::wingfoil::Stream<PyElement>>> =
+            Vec::with_capacity(streams.len());
+        for obj in &streams {
+            let stream = obj
+                .extract::<PyRef<PyStream>>(py)
+                .map_err(|_| types::py_type_error("nmap: every stream argument must be a Stream"))
+                .to_pyresult()?;
+            inner.push(stream.inner_stream());
+        }
+        let peeked = inner.clone();
+        // `combine` ticks once per cycle in which any upstream ticked, after
+        // all of them have cycled, so peeking here always sees current values.
+        let stream = ::wingfoil::StreamOperators::try_map(
+            &::wingfoil::combine(inner),
+            move |_: ::wingfoil::Burst<PyElement>| {
+                Python::attach(|py| {
+                    let vals = peeked
+                        .iter()
+                        .map(|s| s.peek_value().value())
+                        .collect::<Vec<_>>();
+                    let args = pyo3::types::PyTuple::new(py, &vals)
+                        .expect("invariant: tuple of stream values cannot fail");
+                    let res = func.call1(py, args).map_err(py_callback_error)?;
+                    Ok(PyElement::new(res))
+                })
+            },
+        );
+        Ok(PyStream(stream))
+    })
+}
+
+/// Reads the current value of every stream in a single call. A fan-in
+/// `cycle()` that peeks each upstream individually pays one Python→Rust
+/// crossing per upstream per tick; this batches them into one.
+#[pyfunction]
+fn peek_values(streams: Vec<Py<PyAny>>) -> PyResult<Vec<Py<PyAny>>> {
+    Python::attach(|py| {
+        let mut values = Vec::with_capacity(streams.len());
+        for obj in &streams {
+            let stream = obj
+                .extract::<PyRef<PyStream>>(py)
+                .map_err(|_| types::py_type_error("peek_values: every argument must be a Stream"))
+                .to_pyresult()?;
+            values.push(stream.inner_stream().peek_value().value());
+        }
+        Ok(values)
+    })
+}
+
 #[pyclass(unsendable, name = "Graph", from_py_object)]
 #[derive(Clone)]
 pub(crate) struct PyGraph(Vec<Rc<dyn Node>>);
@@ -196,11 +252,18 @@ impl PyGraph {
 /// trading and real-time AI systems
 #[pymodule]
 fn _wingfoil(module: &Bound<'_, PyModule>) -> PyResult<()> {
-    let env = env_logger::Env::default().default_filter_or("info");
+    // RUST_LOG still wins when set; WINGFOIL_LOG_LEVEL supplies the default
+    // so e.g. WINGFOIL_LOG_LEVEL=warn makes `.logged(..)` wire no node at
+    // all (the builder returns the upstream unchanged for a disabled level),
+    // letting benchmarks measure throughput without per-tick stdout writes.
+    let default_level = std::env::var("WINGFOIL_LOG_LEVEL").unwrap_or_else(|_| "info".to_string());
+    let env = env_logger::Env::default().default_filter_or(default_level);
     env_logger::Builder::from_env(env).init();
     module.add_function(wrap_pyfunction!(ticker, module)?)?;
     module.add_function(wrap_pyfunction!(constant, module)?)?;
     module.add_function(wrap_pyfunction!(bimap, module)?)?;
+    module.add_function(wrap_pyfunction!(nmap, module)?)?;
+    module.add_function(wrap_pyfunction!(peek_values, module)?)?;
     module.add_function(wrap_pyfunction!(py_csv::py_csv_read, module)?)?;
     #[cfg(feature = "etcd")]
     module.add_function(wrap_pyfunction!(py_etcd::py_etcd_sub, module)?)?;
@@ -170,8 +170,15 @@ impl PyStream {
 
     // begin StreamOperators
 
-    fn collect(&self) -> PyStream {
-        let strm = self.0.collect().map(|items| {
+    /// `capacity` preallocates the accumulator when the tick count is known
+    /// up front (e.g. the stream ends in `limit(n)`).
+    #[pyo3(signature = (capacity=None))]
+    fn collect(&self, capacity: Option<usize>) -> PyStream {
+        let collected = match capacity {
+            Some(n) => self.0.collect_with_capacity(n),
+            None => self.0.collect(),
+        };
+        let strm = collected.map(|items| {
             Python::attach(move |py| {
                 let items = items
                     .iter()
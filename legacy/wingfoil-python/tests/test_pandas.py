@@ -8,6 +8,13 @@ class SimpleObj:
         self.a = a
         self.b = b
 
+class SlottedObj:
+    __slots__ = ("a", "b")
+
+    def __init__(self, a, b):
+        self.a = a
+        self.b = b
+
 def test_empty_list():
     df = to_dataframe([])
     assert df.empty
@@ -40,7 +47,24 @@ def test_to_dataframe_legacy_primitives():
     assert len(df) == 3
     assert df.columns[0] == "value"
     assert df.iloc[0]["value"] == 10.5
-    
+
+
+def test_to_dataframe_with_int_primitives():
+    # Ints take the same numeric fast path as floats
+    df = to_dataframe([1, 2, 3])
+    assert len(df) == 3
+    assert df.columns[0] == "value"
+    assert df.iloc[1]["value"] == 2
+
+
+def test_to_dataframe_with_mixed_primitive_list():
+    # A non-numeric tail must not be stringified by the numeric fast path
+    df = to_dataframe([1, 2, "x"])
+    assert len(df) == 3
+    assert df.iloc[0]["value"] == 1
+    assert df.iloc[2]["value"] == "x"
+
+
 def test_dict_of_streams():
     source = ticker(0.01).count().limit(3)
     
@@ -171,6 +195,62 @@ def test_to_dataframe_with_object_list():
     assert df.iloc[1]["b"] == 8
 
 
+def test_to_dataframe_with_slotted_object_list():
+    """Slotted row objects (no __dict__) expand to their fields too."""
+    data = [SlottedObj(a=5, b=6), SlottedObj(a=7, b=8)]
+    df = to_dataframe(data)
+    assert len(df) == 2
+    assert "a" in df.columns
+    assert df.iloc[1]["b"] == 8
+
+
+def test_to_dataframe_time_tuples_with_slotted_objects():
+    data = [(1.0, SlottedObj(a=10, b=20)), (2.0, SlottedObj(a=30, b=40))]
+    df = to_dataframe(data)
+    assert len(df) == 2
+    assert list(df.columns) == ["time", "a", "b"]
+    assert df.iloc[1]["a"] == 30
+
+
+def test_to_dataframe_with_ragged_object_list():
+    """Objects missing a field fall back to the vars() row-dict path."""
+    partial = SimpleObj(a=1, b=2)
+    del partial.b
+    data = [SimpleObj(a=3, b=4), partial]
+    df = to_dataframe(data)
+    assert len(df) == 2
+    assert pd.isna(df.iloc[1]["b"])
+
+
+def test_to_dataframe_with_extra_attribute_object_list():
+    """A later row with extra attributes must union, not silently drop them."""
+    wide = SimpleObj(a=3, b=4)
+    wide.c = 5
+    df = to_dataframe([SimpleObj(a=1, b=2), wide])
+    assert list(df.columns) == ["a", "b", "c"]
+    assert pd.isna(df.iloc[0]["c"])
+    assert df.iloc[1]["c"] == 5
+
+
+def test_to_dataframe_with_fieldless_object_list():
+    """Objects with an empty __dict__ yield an empty-column frame."""
+
+    class Fieldless:
+        pass
+
+    df = to_dataframe([Fieldless(), Fieldless()])
+    assert len(df) == 2
+    assert list(df.columns) == []
+
+
+def test_to_dataframe_with_ragged_dict_list():
+    """A ragged dict schema falls back to the row-wise pandas constructor."""
+    data = [{"x": 1, "y": 2}, {"x": 3}]
+    df = to_dataframe(data)
+    assert len(df) == 2
+    assert pd.isna(df.iloc[1]["y"])
+
+
 def test_to_dataframe_with_raw_dict():
     """to_dataframe with a plain dict (lines 27-28)."""
     data = {"col1": [1, 2, 3], "col2": [4, 5, 6]}
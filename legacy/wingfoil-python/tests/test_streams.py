@@ -1,7 +1,7 @@
 import unittest
 from datetime import datetime, timedelta, timezone
 
-from wingfoil import Graph, bimap, constant, ticker
+from wingfoil import Graph, bimap, constant, nmap, peek_values, ticker
 
 
 class TestBasicOperators(unittest.TestCase):
@@ -36,6 +36,33 @@ class TestBasicOperators(unittest.TestCase):
         stream.run(realtime=False, cycles=5)
         self.assertEqual(stream.peek_value(), [0, 1, 2])
 
+    def test_nmap_combines_current_values(self):
+        src = ticker(0.1).count()
+        tens = src.map(lambda x: x * 10)
+        hundreds = src.map(lambda x: x * 100)
+        zipped = nmap([src, tens, hundreds], lambda a, b, c: a + b + c).collect()
+        zipped.run(realtime=False, cycles=3)
+        self.assertEqual(zipped.peek_value(), [111, 222, 333])
+
+    def test_nmap_rejects_non_streams(self):
+        with self.assertRaises(TypeError):
+            nmap([ticker(0.1).count(), 42], lambda a, b: a)
+
+    def test_peek_values_batch_read(self):
+        counts = ticker(0.1).count()
+        tens = counts.map(lambda x: x * 10)
+        Graph([counts, tens]).run(realtime=False, cycles=3)
+        self.assertEqual(peek_values([counts, tens]), [3, 30])
+
+    def test_peek_values_rejects_non_streams(self):
+        with self.assertRaises(TypeError):
+            peek_values([ticker(0.1).count(), "not a stream"])
+
+    def test_collect_with_capacity(self):
+        stream = ticker(0.1).count().limit(3).collect(capacity=3)
+        stream.run(realtime=False, cycles=5)
+        self.assertEqual(stream.peek_value(), [1, 2, 3])
+
     def test_drop_small_change(self):
         predicate_calls = []
         prices = [100.000, 100.005, 100.020, 100.025]
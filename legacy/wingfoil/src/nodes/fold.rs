@@ -23,6 +23,20 @@ impl<IN: Element, OUT: Element> MutableNode for FoldStream<IN, OUT> {
 }
 
 impl<IN: Element, OUT: Element> FoldStream<IN, OUT> {
+    /// Like [`FoldStream::new`] but with a caller-supplied initial
+    /// accumulator — e.g. a `Vec` preallocated to a known final length.
+    pub fn with_initial(
+        upstream: Rc<dyn Stream<IN>>,
+        func: Box<dyn Fn(&mut OUT, IN)>,
+        value: OUT,
+    ) -> Self {
+        FoldStream {
+            upstream,
+            func,
+            value,
+        }
+    }
+
     /// The node's cycle logic, single-sourced: `MutableNode::cycle` delegates
     /// here. Keeping it in a standalone method lets callers invoke it directly
     /// for static dispatch without the `GraphState`/`Result` plumbing.
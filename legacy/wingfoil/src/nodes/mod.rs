@@ -410,6 +410,11 @@ pub trait StreamOperators<T: Element> {
     /// the graph has completed running. Useful for unit tests.
     #[must_use]
     fn collect(self: &Rc<Self>) -> Rc<dyn Stream<Vec<ValueAt<T>>>>;
+    /// [collect](StreamOperators::collect) with the accumulator preallocated
+    /// for `capacity` values — use when the tick count is known up front
+    /// (e.g. upstream of a `limit(n)`) to avoid repeated growth reallocations.
+    #[must_use]
+    fn collect_with_capacity(self: &Rc<Self>, capacity: usize) -> Rc<dyn Stream<Vec<ValueAt<T>>>>;
     /// collapses a burst (i.e. IntoIter\[T\]) of ticks into a single tick \[T\].
     /// Does not tick if burst is empty.
     #[must_use]
@@ -558,7 +563,9 @@ pub trait StreamOperators<T: Element> {
     /// propagates source up to limit times
     #[must_use]
     fn limit(self: &Rc<Self>, limit: u32) -> Rc<dyn Stream<T>>;
-    /// logs source and propagates it
+    /// logs source and propagates it.  When `level` is disabled at wiring
+    /// time no logging node is inserted at all — the upstream is returned
+    /// unchanged, so a quietened run pays nothing per tick.
     #[must_use]
     fn logged(self: &Rc<Self>, label: &str, level: Level) -> Rc<dyn Stream<T>>;
     /// Map's it's source into a new Stream using the supplied closure.
@@ -637,14 +644,23 @@ where
     }
 
     fn collect(self: &Rc<Self>) -> Rc<dyn Stream<Vec<ValueAt<T>>>> {
-        bimap(
+        self.collect_with_capacity(0)
+    }
+
+    fn collect_with_capacity(self: &Rc<Self>, capacity: usize) -> Rc<dyn Stream<Vec<ValueAt<T>>>> {
+        let timed = bimap(
             Dep::Active(self.clone()),
             Dep::Active(self.clone().as_node().ticked_at()),
             ValueAt::new,
+        );
+        FoldStream::with_initial(
+            timed,
+            Box::new(|acc: &mut Vec<ValueAt<T>>, value| {
+                acc.push(value);
+            }),
+            Vec::with_capacity(capacity),
         )
-        .fold(|acc: &mut Vec<ValueAt<T>>, value| {
-            acc.push(value);
-        })
+        .into_stream()
     }
 
     fn collapse<OUT>(self: &Rc<Self>) -> Rc<dyn Stream<OUT>>
@@ -1110,6 +1126,17 @@ mod tests {
         assert_eq!(ticks[0].value, 2u64); // last() of [1,2]
     }
 
+    #[test]
+    fn collect_with_capacity_matches_collect() {
+        let source = ticker(Duration::from_nanos(100)).count();
+        let collected = source.collect_with_capacity(4);
+        collected
+            .run(RunMode::HistoricalFrom(NanoTime::ZERO), RunFor::Cycles(4))
+            .unwrap();
+        let values: Vec<u64> = collected.peek_value().iter().map(|v| v.value).collect();
+        assert_eq!(values, vec![1, 2, 3, 4]);
+    }
+
     #[test]
     fn filter_map_keeps_some_drops_none() {
         // count() → 1,2,3,4,5,6; keep squares of odd inputs only: 1,9,25